@@ -162,8 +162,7 @@ class HexLattice(Lattice):
                 isclose(self.pitch, other.pitch, rel_tol=TOL) and
                 self.outer_material == other.outer_material   and
                 self.num_rings == other.num_rings             and
-                all(self.elements[i][j] == other.elements[i][j]
-                    for i in range(self.num_rings) for j in range(len(self.elements[i])))
+                self._elements_equal(other)
                 )
 
     def __hash__(self) -> int:
@@ -39,6 +39,33 @@ class Lattice(GeometryElement):
         self.outer_material = outer_material
         super().__init__(name)
 
+    def _elements_equal(self, other: "Lattice") -> bool:
+        """ Helper method for comparing the elements of two lattices with identical layouts
+
+        Lattices tend to reference the same few element objects many times over,
+        so each distinct pair of element objects is only compared once.
+
+        Parameters
+        ----------
+        other : Lattice
+            The lattice whose elements are to be compared against
+
+        Returns
+        -------
+        bool
+            True if all corresponding elements of the two lattices are equal
+        """
+        compared = set()
+        for row, other_row in zip(self.elements, other.elements):
+            for element, other_element in zip(row, other_row):
+                pair = (id(element), id(other_element))
+                if pair in compared:
+                    continue
+                if element != other_element:
+                    return False
+                compared.add(pair)
+        return True
+
     def get_materials(self) -> List[Material]:
         materials = [self.outer_material]
         for row in self.elements:
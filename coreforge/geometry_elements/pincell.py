@@ -45,6 +45,8 @@ class PinCell(GeometryElement):
             The rotation of the shape about its origin (degrees)
         """
 
+        __slots__ = ('_name', '_shape', '_material', '_rotation')
+
         @property
         def name(self) -> str:
             return self._name
@@ -91,8 +91,7 @@ class RectLattice(Lattice):
                 self.outer_material == other.outer_material         and
                 self.shape[0] == other.shape[0]                     and
                 self.shape[1] == other.shape[1]                     and
-                all(self.elements[i][j] == other.elements[i][j]
-                    for i in range(self.shape[0]) for j in range(self.shape[1]))
+                self._elements_equal(other)
                 )
 
     def __hash__(self) -> int:
@@ -42,6 +42,8 @@ class Stack(GeometryElement):
             The length of the segment
         """
 
+        __slots__ = ('_element', '_length')
+
         @property
         def element(self) -> GeometryElement:
             return self._element
@@ -1,7 +1,8 @@
 from abc import ABC
-from typing import Dict, Any, Iterable, List
+from typing import Dict, Any, Iterable, List, Tuple
 from math import isclose
 
+import numpy as np
 import openmc
 from mpactpy.utils import relative_round, ROUNDING_RELATIVE_TOLERANCE as TOL
 
@@ -56,25 +57,56 @@ class Material(ABC):
 
         self._openmc_material             = openmc_material.clone()
         self._openmc_material.temperature = self.temperature if self.temperature is not None else ROOM_TEMPERATURE
+        self._hash                        = None
+        self._nuclide_densities           = None
 
 
     def __eq__(self, other: Any) -> bool:
         if self is other:
             return True
-        return (isinstance(other, Material)                                   and
-                isclose(self.density, other.density, rel_tol=TOL)             and
-                isclose(self.temperature, other.temperature, rel_tol=TOL)     and
-                self.number_densities.keys() == other.number_densities.keys() and
-                all(isclose(self.number_densities[iso], other.number_densities[iso], rel_tol=TOL)
-                    for iso in self.number_densities.keys())
+        if not (isinstance(other, Material)                               and
+                isclose(self.density, other.density, rel_tol=TOL)         and
+                isclose(self.temperature, other.temperature, rel_tol=TOL)):
+            return False
+
+        nuclides, densities             = self._get_nuclide_densities()
+        other_nuclides, other_densities = other._get_nuclide_densities()
+        # Same criterion as math.isclose(a, b, rel_tol=TOL), evaluated for all nuclides at once
+        return (nuclides == other_nuclides and
+                bool(np.all(np.abs(densities - other_densities) <=
+                            TOL * np.maximum(np.abs(densities), np.abs(other_densities))))
         )
 
     def __hash__(self) -> int:
-        number_densities = sorted({iso: relative_round(numd, TOL)
-                                   for iso, numd in self.number_densities.items()})
-        return hash((relative_round(self.density, TOL),
-                     relative_round(self.temperature, TOL),
-                     tuple(number_densities)))
+        # Hashing walks every nuclide in the OpenMC material, so the result is cached.
+        # Modifying ``openmc_material`` in-place will not reset the cache.
+        if self._hash is None:
+            nuclides, _ = self._get_nuclide_densities()
+            self._hash  = hash((relative_round(self.density, TOL),
+                                relative_round(self.temperature, TOL),
+                                nuclides))
+        return self._hash
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cached hash is built from nuclide-name strings, whose hashes differ between
+        # processes, so it is left out of the pickled state and recomputed on first use
+        state          = self.__dict__.copy()
+        state['_hash'] = None
+        return state
+
+    def _get_nuclide_densities(self) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """ Returns the sorted nuclide names and their number densities as an aligned array
+
+        OpenMC recomputes the number densities on every request, so the result is cached.
+        Like the hash, modifying ``openmc_material`` in-place will not reset the cache.
+        """
+        if self._nuclide_densities is None:
+            number_densities        = self.number_densities
+            nuclides                = tuple(sorted(number_densities))
+            densities               = np.fromiter((number_densities[nuclide] for nuclide in nuclides),
+                                                  dtype=float, count=len(nuclides))
+            self._nuclide_densities = (nuclides, densities)
+        return self._nuclide_densities
 
 
 def unique_materials(materials: Iterable["Material"]) -> List["Material"]:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Generic, Optional, TypeVar
+from typing import Dict, Generic, Optional, Tuple, TypeVar
 
 import mpactpy
 
@@ -102,6 +103,10 @@ class Builder(ABC, Generic[T]):
         raise NotImplementedError
 
 
+_BUILT_MATERIALS: Dict[Tuple[int, int],
+                       Tuple[Optional[mpactpy.Material.MPACTSpecs], mpactpy.Material]] = {}
+
+
 def build_material(material: Material, specs: Optional[MaterialSpecs] = None) -> mpactpy.Material:
     """Function for building an MPACT Material from a given Material.
 
@@ -110,6 +115,14 @@ def build_material(material: Material, specs: Optional[MaterialSpecs] = None) ->
     for the material type. If no default specifications for the material type are found, then
     the mpactpy.Material constructor default will be used.
 
+    Built materials are cached, so building the same material object with the same
+    specifications again returns the previously built MPACT Material rather than converting
+    it anew.  The material should therefore not be modified in-place after it is built.
+    Specifications are matched by identity as well, so the MPACTSpecs used for a build,
+    including those in DEFAULT_MPACT_MATERIAL_SPECS, should not be modified in-place either;
+    doing so would silently return the material built with the old specifications.
+    Cache entries are dropped once the material they were built from is garbage collected.
+
     Parameters
     ----------
     material : Material
@@ -120,19 +133,48 @@ def build_material(material: Material, specs: Optional[MaterialSpecs] = None) ->
     Returns
     -------
     mpactpy.Material
-        A new MPACT Material.
+        The MPACT Material.
     """
 
-    openmc_material = material.openmc_material
+    mpact_specs = _find_mpact_specs(material, specs)
+
+    # Keyed on identity to avoid hashing the material's number densities on every call.
+    # The specs are kept alongside the result so their id stays valid as a key, while the
+    # material is only weakly referenced: its entries are purged when it is collected,
+    # before its id can be reused by another material.
+    key   = (id(material), id(mpact_specs))
+    entry = _BUILT_MATERIALS.get(key)
+    if entry is None:
+        openmc_material = material.openmc_material
+        mpact_material  = mpactpy.Material.from_openmc_material(openmc_material) if mpact_specs is None else \
+                          mpactpy.Material.from_openmc_material(openmc_material, mpact_specs)
+        entry = _BUILT_MATERIALS[key] = (mpact_specs, mpact_material)
+        weakref.finalize(material, _BUILT_MATERIALS.pop, key, None).atexit = False
+    return entry[1]
+
+
+def _find_mpact_specs(material: Material,
+                      specs: Optional[MaterialSpecs]) -> Optional[mpactpy.Material.MPACTSpecs]:
+    """Function for finding the MPACT specifications to build a given Material with
+
+    Parameters
+    ----------
+    material : Material
+        The material to be built.
+    specs : Optional[MaterialSpecs]
+        The build specifications.
+
+    Returns
+    -------
+    Optional[mpactpy.Material.MPACTSpecs]
+        The specifications for the material, or None if the mpactpy.Material defaults should be used.
+    """
 
     if specs is not None and material in specs:
-        mpact_specs = specs[material]
-        return mpactpy.Material.from_openmc_material(openmc_material, mpact_specs)
+        return specs[material]
 
-    cls = type(material)
-    while cls is not object:
+    for cls in type(material).__mro__:
         mpact_specs = DEFAULT_MPACT_MATERIAL_SPECS.get(cls)
         if mpact_specs:
-            return mpactpy.Material.from_openmc_material(openmc_material, mpact_specs)
-        cls = cls.__base__
-    return mpactpy.Material.from_openmc_material(openmc_material)
+            return mpact_specs
+    return None
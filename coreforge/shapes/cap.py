@@ -29,6 +29,8 @@ class Cap(Shape_3D):
         Height (i.e. highest point of the cap) (cm)
     """
 
+    __slots__ = ('_D', '_h')
+
     @property
     def D(self) -> float:
         return self._D
@@ -78,6 +80,8 @@ class Torispherical_Dome(Cap):
            Accessed 05/01/2024. https://mathworld.wolfram.com/TorisphericalDome.html
     """
 
+    __slots__ = ('_R', '_a', '_c', '_r')
+
     @property
     def R(self) -> float:
         return self._R
@@ -123,9 +127,11 @@ class Torispherical_Dome(Cap):
                 isclose(self.c, other.c, rel_tol=TOL))
 
     def __hash__(self) -> int:
-        return hash((relative_round(self.R, TOL),
-                     relative_round(self.a, TOL),
-                     relative_round(self.c, TOL)))
+        if self._hash is None:
+            self._hash = hash((relative_round(self.R, TOL),
+                               relative_round(self.a, TOL),
+                               relative_round(self.c, TOL)))
+        return self._hash
 
     def make_region(self) -> openmc.Region:
         base_plane   = openmc.ZPlane(z0=0.0)
@@ -173,6 +179,8 @@ class ASME_Flanged_Dished_Dome(Torispherical_Dome):
            https://doi.org/10.1201/9781003352051.
     """
 
+    __slots__ = ()
+
     def __init__(self, D: float):
         R = D
         a = 0.06*D
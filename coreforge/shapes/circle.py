@@ -18,17 +18,26 @@ class Circle(Shape_2D):
     ----------
     r : float
         The radius of the circle (cm)
+    r_squared : float
+        The squared radius of the circle (cm^2)
     """
 
+    __slots__ = ('_r_squared',)
+
     @property
     def r(self) -> float:
         return self._inner_radius
 
+    @property
+    def r_squared(self) -> float:
+        return self._r_squared
+
     def __init__(self, r: float):
         assert r >= 0.
         super().__init__(inner_radius = r,
                          outer_radius = r,
                          area         = pi*r*r)
+        self._r_squared = r*r
 
     def __eq__(self, other: Any) -> bool:
         if self is other:
@@ -37,7 +46,9 @@ class Circle(Shape_2D):
                 isclose(self.r, other.r, rel_tol=TOL))
 
     def __hash__(self) -> int:
-        return hash(relative_round(self.r, TOL))
+        if self._hash is None:
+            self._hash = hash(relative_round(self.r, TOL))
+        return self._hash
 
     def make_region(self) -> openmc.Region:
         return -openmc.ZCylinder(r=self.r)
@@ -66,5 +77,5 @@ class Circle(Shape_2D):
         dx = point[0] - center[0]
         dy = point[1] - center[1]
         dist_sq = dx * dx + dy * dy
-        radius_sq = self.r * self.r
+        radius_sq = self.r_squared
         return dist_sq < radius_sq or isclose(dist_sq, radius_sq, rel_tol=TOL)
@@ -30,6 +30,8 @@ class Cone(Shape_3D):
         The height from base to apex (cm)
     """
 
+    __slots__ = ('_r', '_h')
+
     @property
     def r(self) -> float:
         return self._r
@@ -57,7 +59,9 @@ class Cone(Shape_3D):
                 isclose(self.h, other.h, rel_tol=TOL))
 
     def __hash__(self) -> int:
-        return hash((relative_round(self.r, TOL), relative_round(self.h, TOL)))
+        if self._hash is None:
+            self._hash = hash((relative_round(self.r, TOL), relative_round(self.h, TOL)))
+        return self._hash
 
     def make_region(self) -> openmc.Region:
         """Create a two-sided cone region.
@@ -91,6 +95,8 @@ class OneSidedCone(Shape_3D):
         The height from base to apex (cm)
     """
 
+    __slots__ = ('_r', '_h')
+
     @property
     def r(self) -> float:
         return self._r
@@ -118,7 +124,9 @@ class OneSidedCone(Shape_3D):
                 isclose(self.h, other.h, rel_tol=TOL))
 
     def __hash__(self) -> int:
-        return hash((relative_round(self.r, TOL), relative_round(self.h, TOL)))
+        if self._hash is None:
+            self._hash = hash((relative_round(self.r, TOL), relative_round(self.h, TOL)))
+        return self._hash
 
     def make_region(self) -> openmc.Region:
         """Create a one-sided cone region.
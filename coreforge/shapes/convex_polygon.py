@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from math import isclose
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
 from mpactpy.utils import ROUNDING_RELATIVE_TOLERANCE as TOL
 
@@ -15,6 +15,8 @@ class ConvexPolygon(Shape_2D):
     uses those vertices for point containment and polygon-polygon intersection.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def boundary_points(self,
                         center: Tuple[float, float] = (0.0, 0.0),
@@ -54,19 +56,49 @@ class ConvexPolygon(Shape_2D):
         bool
             True if the point lies inside or on the boundary.
         """
+        return self.contains_points([point], center, rotation)[0]
+
+    def contains_points(self,
+                        points: Sequence[Tuple[float, float]],
+                        center: Tuple[float, float] = (0.0, 0.0),
+                        rotation: float = 0.0) -> List[bool]:
+        """Check whether each of several points lies inside the polygon.
+
+        The polygon vertices and edges are computed once for the whole batch.
+
+        Parameters
+        ----------
+        points : Sequence[Tuple[float, float]]
+            The (x, y) points to test.
+        center : Tuple[float, float]
+            The (x, y) center of the polygon.
+        rotation : float
+            Rotation angle in degrees about the polygon center.
+
+        Returns
+        -------
+        List[bool]
+            For each point, True if it lies inside or on the boundary.
+        """
         vertices = self.boundary_points(center, rotation)
-        sign = 0
-        for vertex, next_vertex in zip(vertices, vertices[1:] + vertices[:1]):
-            cross = ((next_vertex[0] - vertex[0]) * (point[1] - vertex[1]) -
-                     (next_vertex[1] - vertex[1]) * (point[0] - vertex[0]))
-            if isclose(cross, 0.0, rel_tol=TOL):
-                continue
-            curr = 1 if cross > 0.0 else -1
-            if sign == 0:
-                sign = curr
-            elif curr != sign:
-                return False
-        return True
+        edges    = [(vertex, next_vertex[0] - vertex[0], next_vertex[1] - vertex[1])
+                    for vertex, next_vertex in zip(vertices, vertices[1:] + vertices[:1])]
+
+        def contains(point: Tuple[float, float]) -> bool:
+            sign = 0
+            for vertex, edge_x, edge_y in edges:
+                cross = (edge_x * (point[1] - vertex[1]) -
+                         edge_y * (point[0] - vertex[0]))
+                if isclose(cross, 0.0, rel_tol=TOL):
+                    continue
+                curr = 1 if cross > 0.0 else -1
+                if sign == 0:
+                    sign = curr
+                elif curr != sign:
+                    return False
+            return True
+
+        return [contains(point) for point in points]
 
     def _intersects_with_convex_polygon(self,
                                         polygon: "ConvexPolygon",
@@ -156,7 +188,7 @@ class ConvexPolygon(Shape_2D):
         if self.contains_point(circle_center, self_center, self_rotation):
             return True
 
-        radius_sq = circle.r * circle.r
+        radius_sq = circle.r_squared
         vertices = self.boundary_points(self_center, self_rotation)
         for vertex, next_vertex in zip(vertices, vertices[1:] + vertices[:1]):
             edge_x = next_vertex[0] - vertex[0]
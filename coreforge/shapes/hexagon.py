@@ -28,6 +28,8 @@ class Hexagon(ConvexPolygon):
         parallel with the y-axis
     """
 
+    __slots__ = ('_orientation',)
+
     @property
     def orientation(self) -> str:
         return self._orientation
@@ -52,7 +54,9 @@ class Hexagon(ConvexPolygon):
                 self.orientation == other.orientation)
 
     def __hash__(self) -> int:
-        return hash((relative_round(self.inner_radius, TOL), self.orientation))
+        if self._hash is None:
+            self._hash = hash((relative_round(self.inner_radius, TOL), self.orientation))
+        return self._hash
 
     def make_region(self) -> openmc.Region:
         return -openmc.model.HexagonalPrism(edge_length=self._outer_radius, orientation=self.orientation)
@@ -25,6 +25,8 @@ class Rectangle(ConvexPolygon):
         The width of the rectangle (cm)
     """
 
+    __slots__ = ('_h', '_w')
+
     @property
     def h(self) -> float:
         return self._h
@@ -50,8 +52,10 @@ class Rectangle(ConvexPolygon):
                 isclose(self.w, other.w, rel_tol=TOL))
 
     def __hash__(self) -> int:
-        return hash((relative_round(self.h, TOL),
-                     relative_round(self.w, TOL)))
+        if self._hash is None:
+            self._hash = hash((relative_round(self.h, TOL),
+                               relative_round(self.w, TOL)))
+        return self._hash
 
     def make_region(self) -> openmc.Region:
         return -openmc.model.RectangularPrism(width=self.w, height=self.h)
@@ -103,6 +107,8 @@ class Square(Rectangle):
         The side length of the square (cm)
     """
 
+    __slots__ = ()
+
     @property
     def length(self) -> float:
         return self._w
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 import re
-from typing import Any, Callable, Tuple, TypeVar, cast
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TypeVar, cast
 
 import openmc
 
@@ -27,6 +27,10 @@ def _intersection_method_names(shape: Shape):
 class Shape(ABC):
     """ An abstract class for channel shapes
 
+    Shapes are immutable: they cache their hash on first use and a deep copy returns
+    the shape itself, so zones, channels, etc. copied from one another share their shapes.
+    Subclasses must therefore not allow a shape to be modified after construction.
+
     Attributes
     ----------
     inner_radius : float
@@ -35,6 +39,8 @@ class Shape(ABC):
         The outer-radius of the shape (cm)
     """
 
+    __slots__ = ('_inner_radius', '_outer_radius', '_hash')
+
     @property
     def inner_radius(self) -> float:
         return self._inner_radius
@@ -50,6 +56,9 @@ class Shape(ABC):
         self._inner_radius = inner_radius
         self._outer_radius = outer_radius
 
+        # Shapes are immutable, so concrete classes cache their hash here on first use
+        self._hash = None
+
     def intersects(self,
                    other: Shape,
                    self_center: Tuple[float, float] = (0.0, 0.0),
@@ -119,6 +128,26 @@ class Shape(ABC):
             hash for this shape
         """
 
+    def __deepcopy__(self: T, memo: Dict[int, Any]) -> T:
+        # Shapes are immutable, so deep copies of zones, channels, etc. can share them
+        return self
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cached hash may depend on string hashes (e.g. Hexagon orientation), which differ
+        # between processes, so it is left out of the pickled state and recomputed on first use
+        # Subclasses that do not declare __slots__ keep their own attributes in __dict__
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name not in ('__dict__', '__weakref__') and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        state['_hash'] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @abstractmethod
     def make_region(self) -> openmc.Region:
         """ A method for creating a new region based on the shape
@@ -139,6 +168,8 @@ class Shape_2D(Shape):
         The area of the shape (cm^2)
     """
 
+    __slots__ = ('_area',)
+
     @property
     def area(self) -> float:
         return self._area
@@ -178,8 +209,10 @@ class Shape_2D(Shape):
         boundary_points = other.boundary_points(other_center, other_rotation)
         if boundary_points is NotImplemented:
             return NotImplemented
-        return all(self.contains_point(point, self_center, self_rotation)
-                   for point in boundary_points)
+        if type(self).contains_points is Shape_2D.contains_points:
+            # Without batched setup to amortize, checking point by point stops at the first miss
+            return all(self.contains_point(point, self_center, self_rotation) for point in boundary_points)
+        return all(self.contains_points(boundary_points, self_center, self_rotation))
 
     def boundary_points(self,
                         center: Tuple[float, float] = (0.0, 0.0),
@@ -204,6 +237,31 @@ class Shape_2D(Shape):
         _ = rotation
         return NotImplemented
 
+    def contains_points(self,
+                        points: Sequence[Tuple[float, float]],
+                        center: Tuple[float, float] = (0.0, 0.0),
+                        rotation: float = 0.0) -> List[bool]:
+        """Check whether each of several points lies inside the shape.
+
+        Shapes with per-query setup (e.g. computing their vertices) override this
+        so the setup is done once for the whole batch rather than once per point.
+
+        Parameters
+        ----------
+        points : Sequence[Tuple[float, float]]
+            The (x, y) points to test.
+        center : Tuple[float, float]
+            The (x, y) center of the shape.
+        rotation : float
+            Rotation angle in degrees about the shape center.
+
+        Returns
+        -------
+        List[bool]
+            For each point, True if it lies inside or on the boundary.
+        """
+        return [self.contains_point(point, center, rotation) for point in points]
+
     @abstractmethod
     def contains_point(self,
                        point: Tuple[float, float],
@@ -236,6 +294,8 @@ class Shape_3D(Shape):
         The volume of the shape (cm^3)
     """
 
+    __slots__ = ('_volume',)
+
     @property
     def volume(self) -> float:
         return self._volume
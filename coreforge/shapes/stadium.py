@@ -25,6 +25,8 @@ class Stadium(Shape_2D):
         The length of the stadium flat sides (cm)
     """
 
+    __slots__ = ('_r', '_a')
+
     @property
     def r(self) -> float:
         return self._r
@@ -50,8 +52,10 @@ class Stadium(Shape_2D):
                 isclose(self.a, other.a, rel_tol=TOL))
 
     def __hash__(self) -> int:
-        return hash((relative_round(self.r, TOL),
-                     relative_round(self.a, TOL)))
+        if self._hash is None:
+            self._hash = hash((relative_round(self.r, TOL),
+                               relative_round(self.a, TOL)))
+        return self._hash
 
     def make_region(self) -> openmc.Region:
         left_circle  = openmc.ZCylinder(x0=-self.a/2., r=self.r)
@@ -81,7 +85,8 @@ class Stadium(Shape_2D):
         """
         x_local, y_local = to_local(point, center, rotation)
 
-        half_a = 0.5 * self.a
+        half_a    = 0.5 * self.a
+        radius_sq = self.r * self.r
         if abs(x_local) <= half_a and (
             abs(y_local) < self.r or isclose(abs(y_local), self.r, rel_tol=TOL)
         ):
@@ -90,7 +95,6 @@ class Stadium(Shape_2D):
         for x_center in (-half_a, half_a):
             dx_c = x_local - x_center
             dist_sq = dx_c * dx_c + y_local * y_local
-            radius_sq = self.r * self.r
             if dist_sq < radius_sq or isclose(dist_sq, radius_sq, rel_tol=TOL):
                 return True
 
@@ -1,8 +1,10 @@
-from typing import List, TypeVar
+from functools import lru_cache
+from typing import List, Tuple, TypeVar
 
 import numpy as np
 
 T = TypeVar('T')
+Position = Tuple[int, int]
 
 def remove_none_2D(map_2D: List[List[T]]) -> List[List[T]]:
     """ Helper function for pruning those rows and columns of the 2D Map that are all None values
@@ -17,8 +19,9 @@ def remove_none_2D(map_2D: List[List[T]]) -> List[List[T]]:
     List[List[T]]
         The resulting pruned 2D map
     """
-    array = np.array(map_2D, dtype=object)
-    return array[~np.all(np.equal(array, None), axis=1)][:, ~np.all(np.equal(array, None), axis=0)].tolist()
+    array   = np.array(map_2D, dtype=object)
+    is_none = np.equal(array, None)
+    return array[np.ix_(~is_none.all(axis=1), ~is_none.all(axis=0))].tolist()
 
 def offset_to_ring(layout: List[List[T]], orientation : str='y') -> List[List[T]]:
     """ Convert a visually structured offset-style hexagonal layout into a ring-based representation.
@@ -78,17 +81,45 @@ def offset_to_ring(layout: List[List[T]], orientation : str='y') -> List[List[T]
                 [     5,  4,  3,     ]]
     """
 
-    def _convert_y_oriented(layout: List[List[T]]) -> List[List[T]]:
-        assert len(layout) % 4 == 1, "Y-oriented layout must have (4*(num_rings-1) + 1) rows"
+    assert orientation in ("x", "X", "y", "Y"), "Orientation must be 'x' or 'y'"
+    orientation = 'x' if orientation == 'X' else orientation
+    orientation = 'y' if orientation == 'Y' else orientation
+
+    positions = _ring_positions(tuple(len(row) for row in layout), orientation)
+    return [[layout[row][col] for row, col in ring] for ring in positions]
+
+@lru_cache(maxsize=None)
+def _ring_positions(row_lengths: Tuple[int, ...], orientation: str) -> Tuple[Tuple[Position, ...], ...]:
+    """ Helper function for finding the offset layout positions of each ring element
+
+    The ring walk depends only on the shape of the offset layout, so the positions are
+    cached and shared by every layout with the same row lengths and orientation.
+
+    Parameters
+    ----------
+    row_lengths : Tuple[int, ...]
+        The number of elements in each row of the offset layout
+    orientation : str
+        The orientation of the hexagons ('x' or 'y')
 
-        num_rings = (len(layout) + 1) // 4 + 1
+    Returns
+    -------
+    Tuple[Tuple[Position, ...], ...]
+        The (row, column) layout position of each element, organized by ring
+        from outermost to innermost
+    """
+
+    def _convert_y_oriented(row_lengths: Tuple[int, ...]) -> List[List[Position]]:
+        assert len(row_lengths) % 4 == 1, "Y-oriented layout must have (4*(num_rings-1) + 1) rows"
+
+        num_rings = (len(row_lengths) + 1) // 4 + 1
         rings     = []
         for i in range(num_rings-1):
             rings.append([])
             ring              = rings[-1]
             num_face_elements = num_rings-1-i
             row               = i*2                 # Starting Row
-            col               = len(layout[row])//2 # Starting Column
+            col               = row_lengths[row]//2 # Starting Column
 
             face_steps = [( 1,  1), # NE Face
                           ( 2,  0), #  E Face
@@ -99,30 +130,29 @@ def offset_to_ring(layout: List[List[T]], orientation : str='y') -> List[List[T]
 
             for drow, dcol in face_steps:
                 for _ in range(num_face_elements):
-                    ring.append(layout[row][col])
+                    ring.append((row, col))
                     row += drow
-                    col += (dcol if dcol > 0 and len(layout[row]) > len(layout[row-drow]) else
-                            dcol if dcol < 0 and len(layout[row]) < len(layout[row-drow]) else 0)
+                    col += (dcol if dcol > 0 and row_lengths[row] > row_lengths[row-drow] else
+                            dcol if dcol < 0 and row_lengths[row] < row_lengths[row-drow] else 0)
 
-        row            = (num_rings - 1) * 2
-        col            = len(layout[row]) // 2
-        center_element = layout[row][col]
-        rings.append([center_element])
+        row = (num_rings - 1) * 2
+        col = row_lengths[row] // 2
+        rings.append([(row, col)])
 
         return rings
 
 
-    def _convert_x_oriented(layout: List[List[T]]) -> List[List[T]]:
-        assert len(layout) % 2 == 1, "X-oriented layout must have (2*(num_rings-1) + 1) rows"
+    def _convert_x_oriented(row_lengths: Tuple[int, ...]) -> List[List[Position]]:
+        assert len(row_lengths) % 2 == 1, "X-oriented layout must have (2*(num_rings-1) + 1) rows"
 
-        num_rings = (len(layout) + 1) // 2
+        num_rings = (len(row_lengths) + 1) // 2
         rings     = []
         for i in range(num_rings-1):
             rings.append([])
             ring              = rings[-1]
             num_face_elements = num_rings-1-i
-            row               = num_rings-1          # Starting Row
-            col               = len(layout[row])-1-i # Starting Column
+            row               = num_rings-1            # Starting Row
+            col               = row_lengths[row]-1-i   # Starting Column
 
             face_steps = [( 1, -1), # SE Face
                           ( 0, -1), #  S Face
@@ -133,19 +163,15 @@ def offset_to_ring(layout: List[List[T]], orientation : str='y') -> List[List[T]
 
             for drow, dcol in face_steps:
                 for _ in range(num_face_elements):
-                    ring.append(layout[row][col])
+                    ring.append((row, col))
                     row += drow
                     col += dcol
 
-        row            = num_rings - 1
-        col            = len(layout[row]) - 1 - (num_rings-1)
-        center_element = layout[row][col]
-        rings.append([center_element])
+        row = num_rings - 1
+        col = row_lengths[row] - 1 - (num_rings-1)
+        rings.append([(row, col)])
 
         return rings
 
-    assert orientation in ("x", "X", "y", "Y"), "Orientation must be 'x' or 'y'"
-    orientation = 'x' if orientation == 'X' else orientation
-    orientation = 'y' if orientation == 'Y' else orientation
-
-    return _convert_y_oriented(layout) if orientation == "y" else _convert_x_oriented(layout)
+    rings = _convert_y_oriented(row_lengths) if orientation == "y" else _convert_x_oriented(row_lengths)
+    return tuple(tuple(ring) for ring in rings)
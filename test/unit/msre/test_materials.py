@@ -1,72 +1,51 @@
 import pytest
-from math import isclose
-
-import mpactpy
+from types import MappingProxyType
 
 from coreforge.materials.msre import Salt, ThimbleGas, Insulation, ControlRodPoison
 import coreforge.mpact_builder as mpact_builder
-from test.unit.test_materials import materials_are_close
+from test.unit.test_materials import materials_are_close, expected_mpact_material
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def salt():
     return Salt()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def thimble_gas():
     return ThimbleGas()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def insulation():
     return Insulation()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def control_rod_poison():
     return ControlRodPoison()
 
-def test_salt(salt):
-    material = mpact_builder.build_material(salt)
-
-    num_dens = {'Li6' : 1.7431446223252428e-06, 'Li7' : 0.02988796955594127,   'F19' : 0.05218107467967278,
-                'Be9' : 0.00898964129413786,    'Zr90': 0.00047974094545786845,'Zr91': 0.00010461989131267802,
-                'Zr92': 0.00015991364848595618, 'Zr94': 0.00016205826301375617,'Zr96': 2.6108350773217338e-05,
-                'U234': 4.115361955751947e-07,  'U235': 4.604270687345431e-05, 'U236': 2.1089771252934387e-07,
-                'U238': 9.891360788333172e-05}
-    expected_material = mpactpy.material.Material(temperature                 = 900.,
-                                                  number_densities            = num_dens,
-                                                  mpact_specs                 = mpact_builder.DEFAULT_MPACT_MATERIAL_SPECS[Salt])
-
-    assert materials_are_close(material, expected_material)
-
-def test_thimble_gas(thimble_gas):
-    material = mpact_builder.build_material(thimble_gas)
-
-    num_dens = {'N14': 4.762813753259977e-05, 'N15': 1.7510327106381968e-07, 'O16': 2.1973775396694824e-06,
-                'O17': 8.347923925535761e-10, 'O18': 4.406117947398875e-09}
-    expected_material = mpactpy.material.Material(temperature                 = 293.6,
-                                                  number_densities            = num_dens,
-                                                  mpact_specs                 = mpact_builder.DEFAULT_MPACT_MATERIAL_SPECS[ThimbleGas])
-
-    assert materials_are_close(material, expected_material)
-
-def test_insulation(insulation):
-    material = mpact_builder.build_material(insulation)
-
-    num_dens = {'Si' : 0.0016057278006239388, 'O16': 0.003210238459575004, 'O17': 1.2171416728729455e-06}
-    expected_material = mpactpy.material.Material(temperature                 = 293.6,
-                                                  number_densities            = num_dens,
-                                                  mpact_specs                 = mpact_builder.DEFAULT_MPACT_MATERIAL_SPECS[Insulation])
-
-    assert materials_are_close(material, expected_material)
-
-def test_control_rod_poison(control_rod_poison):
-    material = mpact_builder.build_material(control_rod_poison)
-
-    num_dens = {'Gd152': 2.7319499017784082e-05, 'Gd154': 0.0002977825392938465, 'Gd155': 0.002021642927316022,
-                'Gd156': 0.002796150724470201,   'Gd157': 0.0021377507981416044, 'Gd158': 0.0033930817780087833,
-                'Gd160': 0.0029860212426438006,  'O16'  : 0.051692735794137225,  'O17'  : 1.9598974877456564e-05,
-                'Al27' : 0.02081514033711775}
-    expected_material = mpactpy.material.Material(temperature                 = 293.6,
-                                                  number_densities            = num_dens,
-                                                  mpact_specs                 = mpact_builder.DEFAULT_MPACT_MATERIAL_SPECS[ControlRodPoison])
-
-    assert materials_are_close(material, expected_material)
+EXPECTED_TEMPERATURES = MappingProxyType({
+    "salt":               900.,
+    "thimble_gas":        293.6,
+    "insulation":         293.6,
+    "control_rod_poison": 293.6,
+})
+
+EXPECTED_NUMBER_DENSITIES = MappingProxyType({
+    "salt":               MappingProxyType({'Li6' : 1.7431446223252428e-06, 'Li7' : 0.02988796955594127,   'F19' : 0.05218107467967278,
+                                            'Be9' : 0.00898964129413786,    'Zr90': 0.00047974094545786845,'Zr91': 0.00010461989131267802,
+                                            'Zr92': 0.00015991364848595618, 'Zr94': 0.00016205826301375617,'Zr96': 2.6108350773217338e-05,
+                                            'U234': 4.115361955751947e-07,  'U235': 4.604270687345431e-05, 'U236': 2.1089771252934387e-07,
+                                            'U238': 9.891360788333172e-05}),
+    "thimble_gas":        MappingProxyType({'N14': 4.762813753259977e-05, 'N15': 1.7510327106381968e-07, 'O16': 2.1973775396694824e-06,
+                                            'O17': 8.347923925535761e-10, 'O18': 4.406117947398875e-09}),
+    "insulation":         MappingProxyType({'Si' : 0.0016057278006239388, 'O16': 0.003210238459575004, 'O17': 1.2171416728729455e-06}),
+    "control_rod_poison": MappingProxyType({'Gd152': 2.7319499017784082e-05, 'Gd154': 0.0002977825392938465, 'Gd155': 0.002021642927316022,
+                                            'Gd156': 0.002796150724470201,   'Gd157': 0.0021377507981416044, 'Gd158': 0.0033930817780087833,
+                                            'Gd160': 0.0029860212426438006,  'O16'  : 0.051692735794137225,  'O17'  : 1.9598974877456564e-05,
+                                            'Al27' : 0.02081514033711775}),
+})
+
+@pytest.mark.parametrize("name", list(EXPECTED_NUMBER_DENSITIES))
+def test_mpact_material(request, name):
+    material = request.getfixturevalue(name)
+    built    = mpact_builder.build_material(material)
+    expected = expected_mpact_material(type(material), EXPECTED_TEMPERATURES[name], EXPECTED_NUMBER_DENSITIES[name])
+    assert materials_are_close(built, expected)
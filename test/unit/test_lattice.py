@@ -105,6 +105,16 @@ def test_rect_lattice_hash(rect_lattice, unequal_rect_lattice):
     assert hash(rect_lattice) == hash(deepcopy(rect_lattice))
     assert hash(rect_lattice) != hash(unequal_rect_lattice)
 
+    lattice = deepcopy(rect_lattice)
+    lattice.pitch = (9., 9.)
+    assert hash(lattice) != hash(rect_lattice)
+
+    # Editing an element through its setters must be reflected in the lattice's hash
+    lattice = deepcopy(rect_lattice)
+    hash(lattice)
+    lattice.elements[0][1].segments[0].length = 2.
+    assert hash(lattice) != hash(rect_lattice)
+
 def test_rect_lattice_openmc_builder(rect_lattice):
     geom_element = rect_lattice
     universe = openmc_builder.build(geom_element)
@@ -194,6 +204,16 @@ def test_hex_lattice_hash(hex_x_lattice, hex_y_lattice):
     assert hash(hex_x_lattice) == hash(deepcopy(hex_x_lattice))
     assert hash(hex_x_lattice) != hash(hex_y_lattice)
 
+    lattice = deepcopy(hex_x_lattice)
+    lattice.pitch = 7.
+    assert hash(lattice) != hash(hex_x_lattice)
+
+    # Editing an element through its setters must be reflected in the lattice's hash
+    lattice = deepcopy(hex_x_lattice)
+    hash(lattice)
+    lattice.elements[0][0].bottom_pos = 1.
+    assert hash(lattice) != hash(hex_x_lattice)
+
 def test_hex_lattice_openmc_builder(hex_x_lattice, hex_y_lattice):
     geom_element = hex_x_lattice
     universe = openmc_builder.build(geom_element)
@@ -1,5 +1,6 @@
 import pytest
 from copy import deepcopy
+from dataclasses import replace
 from math import isclose
 
 from numpy.testing import assert_allclose
@@ -14,18 +15,24 @@ import coreforge.mpact_builder as mpact_builder
 from test.unit.test_materials import graphite
 from test.unit.msre.test_materials import salt
 
+# Shapes are immutable, so the zone shapes are built once and shared by the fixtures
+CIRCLE  = Circle(r=1.)
+SQUARE  = Square(length=4.)
+HEXAGON = Hexagon(inner_radius=8.)
+STADIUM = Stadium(r=12., a=20.)
+
 @pytest.fixture
 def pincell(salt, graphite):
-    zones = [PinCell.Zone(shape = Circle(r=1.),             material = salt),
-             PinCell.Zone(shape = Square(length=4.),        material = graphite, rotation = 45.),
-             PinCell.Zone(shape = Hexagon(inner_radius=8.), material = salt),
-             PinCell.Zone(shape = Stadium(r=12., a=20.),    material = graphite, rotation = 90.)]
+    zones = [PinCell.Zone(shape = CIRCLE,  material = salt),
+             PinCell.Zone(shape = SQUARE,  material = graphite, rotation = 45.),
+             PinCell.Zone(shape = HEXAGON, material = salt),
+             PinCell.Zone(shape = STADIUM, material = graphite, rotation = 90.)]
     return PinCell(zones = zones, outer_material = salt, x0 = 1., y0 = -2.)
 
 @pytest.fixture
 def unequal_pincell(salt, graphite):
-    zones = [PinCell.Zone(shape = Circle(r=1.),          material = salt),
-             PinCell.Zone(shape = Stadium(r=12., a=20.), material = graphite, rotation = 90.)]
+    zones = [PinCell.Zone(shape = CIRCLE,  material = salt),
+             PinCell.Zone(shape = STADIUM, material = graphite, rotation = 90.)]
     return PinCell(zones = zones, outer_material = salt, x0 = 1., y0 = -2.)
 
 @pytest.fixture
@@ -78,6 +85,21 @@ def test_equality_and_hash(pincell, unequal_pincell):
     assert hash(pincell) == hash(deepcopy(pincell))
     assert hash(pincell) != hash(unequal_pincell)
 
+    moved = deepcopy(pincell)
+    moved.x0 = pincell.x0 + 1.
+    assert hash(moved) != hash(pincell)
+
+    # Editing a zone through its setters must be reflected in the pincell's hash
+    edited = deepcopy(pincell)
+    hash(edited)
+    edited.zones[0].shape = Circle(r=0.5)
+    assert hash(edited) != hash(pincell)
+
+    edited = deepcopy(pincell)
+    hash(edited)
+    edited.zones[1].rotation = 30.
+    assert hash(edited) != hash(pincell)
+
 def test_openmc_builder(pincell):
     geom_element = pincell
     universe = openmc_builder.build(geom_element)
@@ -138,51 +160,52 @@ def test_cylindrical_pincell_initialization(cylindrical_pincell):
     expected = unique_materials([zone.material for zone in geom_element.zones] + [geom_element.outer_material])
     assert geom_element.get_materials() == expected
 
-def test_cylindrical_pincell_mpact_builder(cylindrical_pincell, cylindrical_pincell_mpact_specs, salt, graphite):
+@pytest.mark.parametrize("divide_into_quadrants", [False, True])
+def test_cylindrical_pincell_mpact_builder(cylindrical_pincell, cylindrical_pincell_mpact_specs, salt, graphite,
+                                           divide_into_quadrants):
 
     geom_element = cylindrical_pincell
-    specs        = cylindrical_pincell_mpact_specs
+    specs        = replace(cylindrical_pincell_mpact_specs, divide_into_quadrants=divide_into_quadrants)
     bounds       = mpact_builder.Bounds(X=mpact_builder.AxisBounds(min=-4.0, max=4.0),
                                         Y=mpact_builder.AxisBounds(min=-4.0, max=4.0))
     core         = mpact_builder.build(geom_element, specs, bounds)
     salt         = mpact_builder.build_material(salt)
     graphite     = mpact_builder.build_material(graphite)
 
-    assert len(core.materials) == 2
-    assert salt in core.materials
-    assert graphite in core.materials
-
-    assert isclose(core.mod_dim['X'], 8.0)
-    assert isclose(core.mod_dim['Y'], 8.0)
-    assert_allclose(core.mod_dim['Z'], [1.0])
-
-    assert len(core.pins)       == 1
-    assert len(core.modules)    == 1
-    assert len(core.lattices)   == 1
-    assert len(core.assemblies) == 1
-
     expected_radii = [1.0, 2.0, 3.0]
     expected_mats  = [salt, graphite, salt, graphite]
 
-    assert core.pins[0] == Pin(GeneralCylindricalPinMesh(expected_radii, -4.0, 4.0, -4.0, 4.0, [1.0], [1, 1, 1], [1, 1, 1, 1], [1]), expected_mats)
-
-    specs.divide_into_quadrants = True
-    core = mpact_builder.build(geom_element, specs, bounds)
-
-    assert isclose(core.mod_dim['X'], 4.0)
-    assert isclose(core.mod_dim['Y'], 4.0)
-    assert core.lattices[0].nx == 2
-    assert core.lattices[0].ny == 2
-
-    pin = {"NW" : core.lattices[0].module_map[0][0].pin_map[0][0],
-           "NE" : core.lattices[0].module_map[0][1].pin_map[0][0],
-           "SW" : core.lattices[0].module_map[1][0].pin_map[0][0],
-           "SE" : core.lattices[0].module_map[1][1].pin_map[0][0]}
-
-    assert pin["NW"] == Pin(GeneralCylindricalPinMesh(expected_radii, -4.0, 0.0,  0.0, 4.0, [1.0], [1, 1, 1], [1, 1, 1, 1], [1]), expected_mats)
-    assert pin["NE"] == Pin(GeneralCylindricalPinMesh(expected_radii,  0.0, 4.0,  0.0, 4.0, [1.0], [1, 1, 1], [1, 1, 1, 1], [1]), expected_mats)
-    assert pin["SW"] == Pin(GeneralCylindricalPinMesh(expected_radii, -4.0, 0.0, -4.0, 0.0, [1.0], [1, 1, 1], [1, 1, 1, 1], [1]), expected_mats)
-    assert pin["SE"] == Pin(GeneralCylindricalPinMesh(expected_radii,  0.0, 4.0, -4.0, 0.0, [1.0], [1, 1, 1], [1, 1, 1, 1], [1]), expected_mats)
+    if not divide_into_quadrants:
+        assert len(core.materials) == 2
+        assert salt in core.materials
+        assert graphite in core.materials
+
+        assert isclose(core.mod_dim['X'], 8.0)
+        assert isclose(core.mod_dim['Y'], 8.0)
+        assert_allclose(core.mod_dim['Z'], [1.0])
+
+        assert len(core.pins)       == 1
+        assert len(core.modules)    == 1
+        assert len(core.lattices)   == 1
+        assert len(core.assemblies) == 1
+
+        assert core.pins[0] == Pin(GeneralCylindricalPinMesh(expected_radii, -4.0, 4.0, -4.0, 4.0, [1.0], [1, 1, 1], [1, 1, 1, 1], [1]), expected_mats)
+
+    else:
+        assert isclose(core.mod_dim['X'], 4.0)
+        assert isclose(core.mod_dim['Y'], 4.0)
+        assert core.lattices[0].nx == 2
+        assert core.lattices[0].ny == 2
+
+        pin = {"NW" : core.lattices[0].module_map[0][0].pin_map[0][0],
+               "NE" : core.lattices[0].module_map[0][1].pin_map[0][0],
+               "SW" : core.lattices[0].module_map[1][0].pin_map[0][0],
+               "SE" : core.lattices[0].module_map[1][1].pin_map[0][0]}
+
+        assert pin["NW"] == Pin(GeneralCylindricalPinMesh(expected_radii, -4.0, 0.0,  0.0, 4.0, [1.0], [1, 1, 1], [1, 1, 1, 1], [1]), expected_mats)
+        assert pin["NE"] == Pin(GeneralCylindricalPinMesh(expected_radii,  0.0, 4.0,  0.0, 4.0, [1.0], [1, 1, 1], [1, 1, 1, 1], [1]), expected_mats)
+        assert pin["SW"] == Pin(GeneralCylindricalPinMesh(expected_radii, -4.0, 0.0, -4.0, 0.0, [1.0], [1, 1, 1], [1, 1, 1, 1], [1]), expected_mats)
+        assert pin["SE"] == Pin(GeneralCylindricalPinMesh(expected_radii,  0.0, 4.0, -4.0, 0.0, [1.0], [1, 1, 1], [1, 1, 1, 1], [1]), expected_mats)
 
 
 def test_cylindrical_pincell_min_zone_thickness(salt, graphite):
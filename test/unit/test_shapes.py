@@ -1,4 +1,6 @@
+import pickle
 import pytest
+from copy import copy, deepcopy
 from math import isclose, pi, sqrt, asin
 
 from coreforge.shapes import Circle, Rectangle, Square, Stadium, Hexagon, \
@@ -15,6 +17,7 @@ def test_circle():
     assert(isclose(circle.inner_radius,  r))
     assert(isclose(circle.outer_radius,  r))
     assert(isclose(circle.area, pi*r*r))
+    assert(isclose(circle.r_squared, r*r))
 
     equal_circle     = Circle(r=r*(1+TOL))
     not_equal_circle = Circle(r=r*2)
@@ -23,6 +26,7 @@ def test_circle():
     assert circle != not_equal_circle
     assert hash(circle) == hash(equal_circle)
     assert hash(circle) != hash(not_equal_circle)
+    assert deepcopy(circle) is circle
 
     region = circle.make_region()
     assert region is not None
@@ -71,6 +75,24 @@ def test_contains_point_hexagon():
     assert not hexagon.contains_point((2.0, 0.0))
 
 
+def test_contains_points():
+    center = (0.1, -0.1)
+    # (1.1, -0.1) lies on the boundary of each unrotated shape, and (1.15, -0.1) lies
+    # between the hexagon's flat side and its vertex
+    points = [(0.0, 0.0), (0.9, 0.0), (0.0, 0.9), (1.2, 0.0), (0.5, 0.5), (1.1, -0.1), (1.15, -0.1)]
+
+    circle = Circle(r=1.0)
+    assert circle.contains_points(points, center) == [True, True, False, False, True, True, False]
+
+    rectangle = Rectangle(w=2.0, h=1.0)
+    assert rectangle.contains_points(points, center)       == [True, True,  False, False, False, True,  False]
+    assert rectangle.contains_points(points, center, 90.0) == [True, False, True,  False, True,  False, False]
+
+    hexagon = Hexagon(inner_radius=1.0, orientation='y')
+    assert hexagon.contains_points(points, center)       == [True, True, True, False, True, True, False]
+    assert hexagon.contains_points(points, center, 30.0) == [True, True, True, False, True, True, True]
+
+
 def test_contains_point_stadium():
     stadium = Stadium(r=0.5, a=2.0)
     assert stadium.contains_point((0.0, 0.4))
@@ -290,6 +312,31 @@ def test_hexagon():
     assert region is not None
 
 
+def test_pickled_hash_is_recomputed():
+    # Cached hashes may depend on string hashes, which differ between processes, so they are not pickled
+    hexagon = Hexagon(inner_radius=1.0, orientation='y')
+    hash(hexagon)
+    loaded = pickle.loads(pickle.dumps(hexagon))
+    assert loaded._hash is None
+    assert loaded == hexagon
+    assert hash(loaded) == hash(hexagon)
+
+
+class LabeledCircle(Circle):
+    """ A subclass without __slots__, whose extra attributes live in __dict__ """
+    def __init__(self, r: float, label: str):
+        super().__init__(r)
+        self.label = label
+
+
+def test_pickle_subclass_without_slots():
+    circle = LabeledCircle(r=1.0, label='fuel')
+    hash(circle)
+    for loaded in [pickle.loads(pickle.dumps(circle)), copy(circle)]:
+        assert loaded.label == 'fuel'
+        assert loaded == circle
+        assert hash(loaded) == hash(circle)
+
 
 def test_cap():
     D = 100.
@@ -54,6 +54,22 @@ def test_equality_and_hash(stack, unequal_stack):
     assert hash(stack) == hash(deepcopy(stack))
     assert hash(stack) != hash(unequal_stack)
 
+    moved = deepcopy(stack)
+    moved.bottom_pos = stack.bottom_pos + 1.
+    assert hash(moved) != hash(stack)
+
+    # Editing a segment, or the element within it, through their setters must be
+    # reflected in the stack's hash
+    edited = deepcopy(stack)
+    hash(edited)
+    edited.segments[0].length = 2.0
+    assert hash(edited) != hash(stack)
+
+    edited = deepcopy(stack)
+    hash(edited)
+    edited.segments[0].element.zones[0].rotation = 30.
+    assert hash(edited) != hash(stack)
+
 def test_openmc_builder(stack):
     geom_element = stack
     universe = openmc_builder.build(geom_element)